@@ -1,7 +1,7 @@
 from typing import Optional
 
-from .models import Event, TimeInterval, Timetable
-from .scheduler import Scheduler
+from .models import Availability, Event, TimeInterval, Timetable
+from .scheduler import BaseScheduler, get_scheduler_class
 from .schemas import (
     EventCreateSchema,
     SuggestedTimeIntervalSchema,
@@ -56,6 +56,9 @@ async def create_timetable(event: Event, timetable_data: TimetableSchema) -> Tim
     )
     for time_interval_data in timetable_data.time_intervals:
         await create_time_interval(timetable, time_interval_data)
+
+    scheduler = await get_scheduler_class().from_event(event)
+    await save_availability(event, scheduler)
     return timetable
 
 
@@ -69,6 +72,44 @@ async def get_timetables(event: Event) -> list[Timetable]:
     return await Timetable.filter(event=event)
 
 
+async def save_availability(event: Event, scheduler: BaseScheduler) -> Availability:
+    """
+    Persist precomputed availability of participants for the event.
+
+    :param event: event tortoise model
+    :param scheduler: scheduler loaded with all timetables of the event
+    :return: availability - tortoise model
+    """
+    availability, _ = await Availability.update_or_create(
+        defaults=scheduler.dump(), event=event
+    )
+    return availability
+
+
+async def get_scheduler(event: Event) -> BaseScheduler:
+    """
+    Get a scheduler for the event from its persisted availability.
+    The availability is computed and saved if it does not exist yet.
+
+    :param event: event tortoise model
+    :return: scheduler loaded with all timetables of the event
+    """
+    scheduler_class = get_scheduler_class()
+    availability = await Availability.get_or_none(event=event)
+    if availability is not None:
+        return scheduler_class.load(
+            {
+                'participants': availability.participants,
+                'boundaries': availability.boundaries,
+                'segments': availability.segments,
+            }
+        )
+
+    scheduler = await scheduler_class.from_event(event)
+    await save_availability(event, scheduler)
+    return scheduler
+
+
 async def get_suggested_time_intervals(
     event: Event, limit: Optional[int]
 ) -> list[SuggestedTimeIntervalSchema]:
@@ -80,7 +121,7 @@ async def get_suggested_time_intervals(
     :param limit: if specified only `limit` first time intervals will be returned.
     :return: list of suggested time intervals (pydantic models)
     """
-    scheduler = await Scheduler.from_event(event)
+    scheduler = await get_scheduler(event)
     time_intervals = scheduler.get_most_suitable_time_intervals(event.duration, limit)
     return [
         SuggestedTimeIntervalSchema(start=start, end=end, participants=participants)
@@ -12,6 +12,7 @@ class Event(Model):
     duration = fields.TimeDeltaField()
 
     timetables: fields.ReverseRelation['Timetable']
+    availability: fields.OneToOneNullableRelation['Availability']
 
     def __str__(self) -> str:
         return str(self.name)
@@ -52,3 +53,17 @@ class TimeInterval(Model):
 
     def __repr__(self) -> str:
         return f'<{type(self).__name__}(id={self.id})>'
+
+
+class Availability(Model):
+    """Precomputed participants availability during elementary segments of the event."""
+
+    id = fields.IntField(pk=True)
+    participants = fields.JSONField()
+    boundaries = fields.JSONField()
+    segments = fields.JSONField()
+
+    event = fields.OneToOneField('models.Event', related_name='availability')
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__}(id={self.id})>'
@@ -0,0 +1,18 @@
+from intervaltree import Interval
+
+from app.settings import SchedulerBackend, settings
+
+from .base import BaseScheduler
+from .sweep import Scheduler
+
+__all__ = ['BaseScheduler', 'Interval', 'Scheduler', 'get_scheduler_class']
+
+
+def get_scheduler_class() -> type[BaseScheduler]:
+    """Get scheduler implementation selected by `SCHEDULER_BACKEND` setting."""
+    if settings.SCHEDULER_BACKEND == SchedulerBackend.NUMPY:
+        # numpy is an optional dependency
+        from .vectorized import NumpyScheduler  # pylint: disable=C0415
+
+        return NumpyScheduler
+    return Scheduler
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional, Type, TypeVar
+
+from intervaltree import Interval
+
+from ..models import Event
+
+SchedulerType = TypeVar('SchedulerType', bound='BaseScheduler')
+
+# serialized boundaries are integer timestamps in microseconds since the epoch
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_TICK = timedelta(microseconds=1)
+
+
+class BaseScheduler(ABC):
+    """Scheduler for event looking for the most suitable time."""
+
+    def __init__(self, intervals: Iterable[Interval]):
+        # participants are interned to dense ids in alphabetical order,
+        # so sets of them are decoded already sorted
+        self._participants = sorted({interval.data for interval in intervals})
+
+    def _participant_ids(self) -> dict[str, int]:
+        return {participant: i for i, participant in enumerate(self._participants)}
+
+    @classmethod
+    @abstractmethod
+    def from_segments(
+        cls: Type[SchedulerType],
+        participants: list[str],
+        boundaries: list[datetime],
+        segments: list[int],
+    ) -> SchedulerType:
+        """
+        Create an instance of Scheduler from precomputed elementary segments.
+        Segment `i` lasts from `boundaries[i]` to `boundaries[i + 1]`,
+        its participants are encoded as bitmask of indices in `participants`.
+        """
+
+    @abstractmethod
+    def to_segments(self) -> tuple[list[datetime], list[int]]:
+        """Get boundaries of elementary segments and their participants bitmasks."""
+
+    def dump(self) -> dict[str, Any]:
+        """Serialize the scheduler to JSON-compatible compact representation."""
+        boundaries, segments = self.to_segments()
+        return {
+            'participants': self._participants,
+            'boundaries': [(boundary - _EPOCH) // _TICK for boundary in boundaries],
+            'segments': [format(participants, 'x') for participants in segments],
+        }
+
+    @classmethod
+    def load(cls: Type[SchedulerType], data: dict[str, Any]) -> SchedulerType:
+        """Create an instance of Scheduler from its serialized representation."""
+        return cls.from_segments(
+            data['participants'],
+            [_EPOCH + ticks * _TICK for ticks in data['boundaries']],
+            [int(participants, 16) for participants in data['segments']],
+        )
+
+    @abstractmethod
+    def get_most_suitable_time_intervals(
+        self, duration: timedelta, limit: Optional[int] = None
+    ) -> list[Interval]:
+        """
+        Get most suitable time intervals based on the number of active participants.
+        Return not more than `limit` time intervals if specified.
+        """
+
+    @classmethod
+    async def from_event(cls: Type[SchedulerType], event: Event) -> SchedulerType:
+        """Create an instance of Scheduler from tortoise event model."""
+        intervals = []
+        await event.fetch_related('timetables__time_intervals')
+        async for timetable in event.timetables:
+            async for time_interval in timetable.time_intervals:
+                intervals.append(
+                    Interval(
+                        time_interval.start,
+                        time_interval.end,
+                        timetable.participant_name,
+                    )
+                )
+        return cls(intervals)
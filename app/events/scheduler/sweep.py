@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import heapq
+from datetime import datetime, timedelta
+from itertools import chain, groupby
+from operator import itemgetter
+from typing import Iterable, Iterator, Optional
+
+from intervaltree import Interval
+
+from .base import BaseScheduler
+
+# bitmask of all participants, identity element for bitwise AND
+_EVERYONE = -1
+
+# number of participants, left and right boundary indices, participants bitmask
+_Window = tuple[int, int, int, int]
+
+
+class _SlidingIntersection:
+    """
+    Queue of participant bitmasks which keeps bitwise AND of all its elements.
+    Both push and pop take amortized O(1) operations (two-stacks technique).
+    """
+
+    def __init__(self) -> None:
+        # suffix intersections of the elements which will be popped first
+        self._front: list[int] = []
+        # elements pushed after the last flip and their running intersection
+        self._back: list[int] = []
+        self._back_value = _EVERYONE
+
+    def push(self, participants: int) -> None:
+        self._back.append(participants)
+        self._back_value &= participants
+
+    def pop(self) -> None:
+        if not self._front:
+            value = _EVERYONE
+            for participants in reversed(self._back):
+                value &= participants
+                self._front.append(value)
+            self._back.clear()
+            self._back_value = _EVERYONE
+        self._front.pop()
+
+    def value(self) -> int:
+        if not self._front:
+            return self._back_value if self._back else 0
+        return self._front[-1] & self._back_value
+
+
+class Scheduler(BaseScheduler):
+    """
+    Pure python scheduler which sweeps interval boundaries
+    and keeps participants of each segment as a bitmask.
+    """
+
+    def __init__(self, intervals: Iterable[Interval]):
+        intervals = list(intervals)
+        super().__init__(intervals)
+        self._boundaries, self._segments = self._sweep(intervals)
+
+    def _sweep(self, intervals: list[Interval]) -> tuple[list[datetime], list[int]]:
+        """
+        Split the timeline into elementary segments by interval boundaries
+        and find participants who are available during each segment.
+        Segment `i` lasts from `boundaries[i]` to `boundaries[i + 1]`.
+        """
+        ids = self._participant_ids()
+        points = sorted(
+            chain.from_iterable(
+                (
+                    (interval.begin, 1, ids[interval.data]),
+                    (interval.end, -1, ids[interval.data]),
+                )
+                for interval in intervals
+            ),
+            key=itemgetter(0),
+        )
+
+        # number of intervals of each participant covering the current point
+        # (intervals of the same participant may overlap)
+        active = [0] * len(ids)
+        mask = 0
+        boundaries: list[datetime] = []
+        segments: list[int] = []
+        for point, changes in groupby(points, key=itemgetter(0)):
+            for _, delta, participant_id in changes:
+                active[participant_id] += delta
+                if active[participant_id]:
+                    mask |= 1 << participant_id
+                else:
+                    mask &= ~(1 << participant_id)
+            boundaries.append(point)
+            segments.append(mask)
+
+        # nobody is available after the last boundary
+        return boundaries, segments[:-1]
+
+    @classmethod
+    def from_segments(
+        cls, participants: list[str], boundaries: list[datetime], segments: list[int]
+    ) -> Scheduler:
+        scheduler = cls([])
+        scheduler._participants = participants
+        scheduler._boundaries, scheduler._segments = boundaries, segments
+        return scheduler
+
+    def to_segments(self) -> tuple[list[datetime], list[int]]:
+        return self._boundaries, self._segments
+
+    def _decode(self, mask: int) -> list[str]:
+        """Get sorted names of participants encoded by the bitmask."""
+        participants = []
+        while mask:
+            lowest = mask & -mask
+            participants.append(self._participants[lowest.bit_length() - 1])
+            mask ^= lowest
+        return participants
+
+    def _windows(self, duration: timedelta) -> Iterator[_Window]:
+        """
+        Generate all intervals with length greater than duration
+        in chronological order together with their participants.
+        """
+        boundaries, segments = self._boundaries, self._segments
+
+        # two-pointers technique over the elementary segments,
+        # the window contains segments from `left` to `right - 1`
+        window = _SlidingIntersection()
+        right = 0
+        for left in range(len(segments)):
+            # move right pointer until the interval has enough duration
+            while right < len(segments) and (
+                right == left or boundaries[right] - boundaries[left] < duration
+            ):
+                window.push(segments[right])
+                right += 1
+            if boundaries[right] - boundaries[left] < duration:
+                break
+
+            participants = window.value()
+            yield bin(participants).count('1'), left, right, participants
+            window.pop()
+
+    def _top(self, windows: Iterable[_Window], limit: int) -> list[_Window]:
+        """
+        Select `limit` windows with the most participants using a bounded heap.
+        Earlier windows win ties, so the order matches the stable sort.
+        """
+        # the worst of the selected windows is on top of the heap
+        heap: list[tuple[int, int, _Window]] = []
+        for window in windows:
+            count, left, *_ = window
+            if len(heap) < limit:
+                heapq.heappush(heap, (count, -left, window))
+            elif count > heap[0][0]:
+                heapq.heapreplace(heap, (count, -left, window))
+
+            # no window can beat the selected ones if everyone is available
+            if len(heap) == limit and heap[0][0] == len(self._participants):
+                break
+
+        return [window for *_, window in sorted(heap, reverse=True)]
+
+    def get_most_suitable_time_intervals(
+        self, duration: timedelta, limit: Optional[int] = None
+    ) -> list[Interval]:
+        windows = self._windows(duration)
+
+        if limit:
+            candidates = self._top(windows, limit)
+        else:
+            # sort by number of active participants
+            candidates = sorted(windows, key=itemgetter(0), reverse=True)
+
+        # participant names are decoded only for the returned intervals
+        return [
+            Interval(
+                self._boundaries[left],
+                self._boundaries[right],
+                self._decode(participants),
+            )
+            for _, left, right, participants in candidates
+        ]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Optional
+
+import numpy as np
+from intervaltree import Interval
+
+from .base import BaseScheduler
+
+# resolution of integer timestamps
+_TICK = timedelta(microseconds=1)
+
+
+class NumpyScheduler(BaseScheduler):
+    """
+    Scheduler which keeps intervals as int64 epoch arrays
+    and computes coverage of segments with vectorized operations.
+    """
+
+    def __init__(self, intervals: Iterable[Interval]):
+        intervals = list(intervals)
+        super().__init__(intervals)
+        # timestamps are counted from the epoch in the timezone of the intervals
+        tzinfo = intervals[0].begin.tzinfo if intervals else None
+        self._epoch = datetime(1970, 1, 1, tzinfo=tzinfo)
+
+        ids = self._participant_ids()
+        starts = self._to_ticks(interval.begin for interval in intervals)
+        ends = self._to_ticks(interval.end for interval in intervals)
+        participant_ids = np.fromiter(
+            (ids[interval.data] for interval in intervals), dtype=np.intp
+        )
+
+        self._boundaries = np.unique(np.concatenate((starts, ends)))
+        segments_count = max(len(self._boundaries) - 1, 0)
+
+        # mark where intervals of each participant start and end,
+        # the running sum is positive inside of the participant's intervals
+        changes = np.zeros((len(ids), segments_count + 1), dtype=np.int32)
+        np.add.at(
+            changes,
+            (participant_ids, np.searchsorted(self._boundaries, starts)),
+            1,
+        )
+        np.add.at(
+            changes,
+            (participant_ids, np.searchsorted(self._boundaries, ends)),
+            -1,
+        )
+        self._set_coverage(np.cumsum(changes[:, :segments_count], axis=1) > 0)
+
+    def _set_coverage(self, coverage: Any) -> None:
+        """Keep participant x segment boolean coverage matrix in cumulative form."""
+        # number of covered segments since the first boundary for each participant,
+        # any window of segments is covered entirely if the difference matches its size
+        self._covered = np.zeros(
+            (coverage.shape[0], coverage.shape[1] + 1), dtype=np.int32
+        )
+        np.cumsum(coverage, axis=1, out=self._covered[:, 1:])
+
+    @classmethod
+    def from_segments(
+        cls, participants: list[str], boundaries: list[datetime], segments: list[int]
+    ) -> NumpyScheduler:
+        scheduler = cls([])
+        scheduler._participants = participants
+        if boundaries:
+            scheduler._epoch = datetime(1970, 1, 1, tzinfo=boundaries[0].tzinfo)
+        scheduler._boundaries = scheduler._to_ticks(boundaries)
+
+        # unpack bits of each segment into a column of the coverage matrix
+        size = (len(participants) + 7) // 8
+        coverage = np.zeros((len(segments), size * 8), dtype=bool)
+        for i, mask in enumerate(segments):
+            coverage[i] = np.unpackbits(
+                np.frombuffer(mask.to_bytes(size, 'little'), dtype=np.uint8),
+                bitorder='little',
+            )
+        scheduler._set_coverage(coverage[:, : len(participants)].T)
+        return scheduler
+
+    def to_segments(self) -> tuple[list[datetime], list[int]]:
+        coverage = np.packbits(
+            np.diff(self._covered, axis=1) > 0, axis=0, bitorder='little'
+        )
+        return (
+            [self._to_datetime(ticks) for ticks in self._boundaries],
+            [int.from_bytes(column.tobytes(), 'little') for column in coverage.T],
+        )
+
+    def _to_ticks(self, timestamps: Iterable[datetime]) -> Any:
+        return np.fromiter(
+            ((timestamp - self._epoch) // _TICK for timestamp in timestamps),
+            dtype=np.int64,
+        )
+
+    def _to_datetime(self, ticks: int) -> datetime:
+        return self._epoch + int(ticks) * _TICK
+
+    def get_most_suitable_time_intervals(
+        self, duration: timedelta, limit: Optional[int] = None
+    ) -> list[Interval]:
+        boundaries = self._boundaries
+        if len(boundaries) < 2:
+            return []
+
+        # find the first boundary which is at least `duration` after each left one,
+        # the window contains segments from `left` to `right - 1`
+        lefts = np.arange(len(boundaries) - 1)
+        rights = np.searchsorted(boundaries, boundaries[:-1] + duration // _TICK)
+        rights = np.maximum(rights, lefts + 1)
+        valid = rights < len(boundaries)
+        lefts, rights = lefts[valid], rights[valid]
+
+        # sliding-window AND over the participant x segment coverage matrix
+        available = self._covered[:, rights] - self._covered[:, lefts] == (
+            rights - lefts
+        )
+
+        counts = available.sum(axis=0)
+        if limit and limit < len(counts):
+            # select the best windows without sorting all of them,
+            # earlier windows win ties as in the stable sort
+            threshold = np.partition(counts, len(counts) - limit)[-limit]
+            better = np.flatnonzero(counts > threshold)
+            ties = np.flatnonzero(counts == threshold)[: limit - len(better)]
+            candidates = np.concatenate((better, ties))
+        else:
+            candidates = np.arange(len(counts))
+
+        # sort by number of active participants, ties are kept in time order
+        order = candidates[np.argsort(-counts[candidates], kind='stable')]
+
+        # participant names are decoded only for the returned intervals
+        return [
+            Interval(
+                self._to_datetime(boundaries[lefts[i]]),
+                self._to_datetime(boundaries[rights[i]]),
+                [self._participants[j] for j in np.flatnonzero(available[:, i])],
+            )
+            for i in order
+        ]
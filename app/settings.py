@@ -1,10 +1,21 @@
+from enum import Enum
+
 from pydantic import BaseSettings, PostgresDsn
 
 
+class SchedulerBackend(str, Enum):
+    """Implementation of the scheduler, `numpy` requires the optional dependency."""
+
+    PYTHON = 'python'
+    NUMPY = 'numpy'
+
+
 class Settings(BaseSettings):
     DATABASE_URL: PostgresDsn
     DATABASE_TEST_URL: PostgresDsn
 
+    SCHEDULER_BACKEND: SchedulerBackend = SchedulerBackend.PYTHON
+
 
 settings = Settings()
 
@@ -0,0 +1,11 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "availability" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "participants" JSONB NOT NULL,
+    "boundaries" JSONB NOT NULL,
+    "segments" JSONB NOT NULL,
+    "event_id" INT NOT NULL UNIQUE REFERENCES "event" ("id") ON DELETE CASCADE
+);
+COMMENT ON TABLE "availability" IS 'Precomputed participants availability during elementary segments of the event.';
+-- downgrade --
+DROP TABLE IF EXISTS "availability";
@@ -1,11 +1,20 @@
 import pytest
 
-from app.events.crud import create_event, create_timetable, get_event, get_timetables
+from app.events.crud import (
+    create_event,
+    create_timetable,
+    get_event,
+    get_scheduler,
+    get_timetables,
+)
+from app.events.models import Availability
+from app.events.scheduler import Scheduler
 from app.events.schemas import EventCreateSchema, TimetableSchema
 from tests.factories import (
     EventDataFactory,
     EventFactory,
     TimeIntervalDataFactory,
+    TimeIntervalFactory,
     TimetableDataFactory,
     TimetableFactory,
 )
@@ -50,3 +59,31 @@ async def test_get_timetables():
     retrieved_timetables = await get_timetables(event)
 
     assert timetables == retrieved_timetables
+
+
+@pytest.mark.asyncio
+async def test_create_timetable_saves_availability():
+    event = await EventFactory()
+    time_intervals_data = TimeIntervalDataFactory.create_batch(3)
+    timetable_data = TimetableDataFactory(time_intervals=time_intervals_data)
+
+    await create_timetable(event, timetable_data)
+
+    availability = await Availability.get(event=event)
+    scheduler = await Scheduler.from_event(event)
+    assert availability.participants == [timetable_data.participant_name]
+    assert availability.boundaries == scheduler.dump()['boundaries']
+    assert availability.segments == scheduler.dump()['segments']
+
+
+@pytest.mark.asyncio
+async def test_get_scheduler_saves_missing_availability():
+    event = await EventFactory()
+    timetable = await TimetableFactory(event=event)
+    await TimeIntervalFactory(timetable=timetable)
+
+    scheduler = await get_scheduler(event)
+
+    availability = await Availability.get(event=event)
+    assert availability.segments == scheduler.dump()['segments']
+    assert (await get_scheduler(event)).dump() == scheduler.dump()
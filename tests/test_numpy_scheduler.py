@@ -0,0 +1,76 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.events.scheduler import Interval, Scheduler, get_scheduler_class
+from app.settings import SchedulerBackend, settings
+from tests.test_scheduler import sample_intervals
+
+pytest.importorskip('numpy')
+
+from app.events.scheduler.vectorized import (  # noqa: E402 pylint: disable=C0412,C0413
+    NumpyScheduler,
+)
+
+
+def random_intervals(participants, seed):
+    rnd = random.Random(seed)
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    intervals = []
+    for i in range(participants):
+        for _ in range(rnd.randint(1, 5)):
+            begin = start + timedelta(minutes=15 * rnd.randint(0, 200))
+            end = begin + timedelta(minutes=15 * rnd.randint(1, 20))
+            intervals.append(Interval(begin, end, f'user{i}'))
+    return intervals
+
+
+@pytest.mark.parametrize('duration', [timedelta(hours=1), timedelta(hours=2)])
+@pytest.mark.parametrize('limit', [None, 1, 3])
+def test_numpy_scheduler_sample(duration, limit):
+    expected = Scheduler(sample_intervals).get_most_suitable_time_intervals(
+        duration, limit
+    )
+    result = NumpyScheduler(sample_intervals).get_most_suitable_time_intervals(
+        duration, limit
+    )
+    assert result == expected
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize(
+    'duration', [timedelta(minutes=30), timedelta(hours=1), timedelta(hours=3)]
+)
+@pytest.mark.parametrize('limit', [None, 5])
+def test_numpy_scheduler_parity(seed, duration, limit):
+    intervals = random_intervals(participants=30, seed=seed)
+    expected = Scheduler(intervals).get_most_suitable_time_intervals(duration, limit)
+    result = NumpyScheduler(intervals).get_most_suitable_time_intervals(duration, limit)
+    assert result == expected
+
+
+@pytest.mark.parametrize('participants', [0, 3, 30])
+def test_numpy_scheduler_dump_load(participants):
+    intervals = random_intervals(participants, seed=participants)
+    expected = Scheduler(intervals)
+    scheduler = NumpyScheduler(intervals)
+    assert scheduler.dump() == expected.dump()
+
+    loaded = NumpyScheduler.load(expected.dump())
+    assert loaded.dump() == expected.dump()
+    assert loaded.get_most_suitable_time_intervals(
+        timedelta(hours=1)
+    ) == expected.get_most_suitable_time_intervals(timedelta(hours=1))
+
+
+def test_numpy_scheduler_no_intervals():
+    scheduler = NumpyScheduler([])
+    result = scheduler.get_most_suitable_time_intervals(timedelta(hours=2))
+    assert result == []
+
+
+def test_get_scheduler_class(monkeypatch):
+    assert get_scheduler_class() is Scheduler
+    monkeypatch.setattr(settings, 'SCHEDULER_BACKEND', SchedulerBackend.NUMPY)
+    assert get_scheduler_class() is NumpyScheduler
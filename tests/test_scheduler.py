@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -74,3 +74,85 @@ async def test_scheduler_from_event():
     assert result == [
         Interval(time_interval.start, time_interval.end, [timetable.participant_name])
     ]
+
+
+def test_scheduler_overlapping_intervals_of_participant():
+    scheduler = Scheduler(
+        [
+            Interval(
+                datetime(2000, 1, 1, 9, 0, 0), datetime(2000, 1, 1, 11, 0, 0), 'user1'
+            ),
+            Interval(
+                datetime(2000, 1, 1, 10, 0, 0), datetime(2000, 1, 1, 12, 0, 0), 'user1'
+            ),
+            Interval(
+                datetime(2000, 1, 1, 12, 0, 0), datetime(2000, 1, 1, 13, 0, 0), 'user1'
+            ),
+            Interval(
+                datetime(2000, 1, 1, 9, 0, 0), datetime(2000, 1, 1, 13, 0, 0), 'user2'
+            ),
+        ]
+    )
+    result = scheduler.get_most_suitable_time_intervals(timedelta(hours=3))
+    assert result == [
+        Interval(
+            datetime(2000, 1, 1, 9, 0, 0),
+            datetime(2000, 1, 1, 12, 0, 0),
+            ['user1', 'user2'],
+        ),
+        Interval(
+            datetime(2000, 1, 1, 10, 0, 0),
+            datetime(2000, 1, 1, 13, 0, 0),
+            ['user1', 'user2'],
+        ),
+    ]
+
+
+def test_scheduler_many_participants():
+    names = [f'user{i:03}' for i in range(100)]
+    scheduler = Scheduler(
+        Interval(
+            datetime(2000, 1, 1, 8, 0, 0) + timedelta(minutes=i),
+            datetime(2000, 1, 1, 12, 0, 0),
+            name,
+        )
+        for i, name in enumerate(names)
+    )
+    result = scheduler.get_most_suitable_time_intervals(timedelta(hours=2), limit=2)
+    assert result == [
+        Interval(
+            datetime(2000, 1, 1, 9, 39, 0),
+            datetime(2000, 1, 1, 12, 0, 0),
+            names,
+        ),
+        Interval(
+            datetime(2000, 1, 1, 9, 38, 0),
+            datetime(2000, 1, 1, 12, 0, 0),
+            names[:-1],
+        ),
+    ]
+
+
+@pytest.mark.parametrize('limit', [1, 3, 10, 100])
+def test_scheduler_limit_matches_full_ranking(limit):
+    scheduler = Scheduler(sample_intervals)
+    result = scheduler.get_most_suitable_time_intervals(timedelta(hours=1), limit)
+    ranking = scheduler.get_most_suitable_time_intervals(timedelta(hours=1))
+    assert result == ranking[:limit]
+
+
+def test_scheduler_dump_load():
+    intervals = [
+        Interval(
+            interval.begin.replace(tzinfo=timezone.utc),
+            interval.end.replace(tzinfo=timezone.utc),
+            interval.data,
+        )
+        for interval in sample_intervals
+    ]
+    scheduler = Scheduler(intervals)
+    loaded = Scheduler.load(scheduler.dump())
+    assert loaded.dump() == scheduler.dump()
+    assert loaded.get_most_suitable_time_intervals(
+        timedelta(hours=1)
+    ) == scheduler.get_most_suitable_time_intervals(timedelta(hours=1))